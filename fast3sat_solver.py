@@ -37,79 +37,653 @@ Version: 1.0.3
 NOTE:  It seems this can catch all, or almost all, UNSAT up to 6 variables, but it cannot beyond 7 variables.  This needs to be further investigated.
 '''
 
-import networkx as nx
+from array import array
+import importlib
+import itertools
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# largest |literal| _tarjan_2sat takes: its literal indices 2 * (|v| - 1) + 1
+# are stored in int32, so 2**30 is the last one that fits
+_KERNEL_MAX_LIT = 2**30
+
+if njit is not None:
+    @njit(inline='always')
+    def _lit_idx(v):
+        """2 * (|v| - 1) + (v < 0) without abs() or a branch; the negation is idx ^ 1.
+
+        v is an int32 literal with |v| <= _KERNEL_MAX_LIT, which _kernel_literals ensures.
+        """
+        s = v >> 31  # 0 for v > 0, -1 for v < 0
+        return ((v ^ s) - s - 1) * 2 - s
+
+    @njit('void(i4[::1], i4[::1], i8[::1], i4[::1], u1[::1])', cache=True)
+    def _tarjan_2sat(units, unit_ptr, pairs, pair_ptr, unsat):
+        """Numba version of _two_sat_batch's graph build plus _tarjan_2sat_py.
+
+        Problem g is units[unit_ptr[g]:unit_ptr[g + 1]] together with the
+        packed pairs pairs[pair_ptr[g]:pair_ptr[g + 1]] (see _pack).
+        """
+        n_prob = unsat.shape[0]
+        n_units = units.shape[0]
+        n_pairs = pairs.shape[0]
+        n_max = 2 * (n_units + 2 * n_pairs)
+        n_edges = n_units + 2 * n_pairs
+
+        # literal indices of every unit and pair endpoint
+        u_idx = np.empty(n_units, np.int32)
+        x_idx = np.empty(n_pairs, np.int32)
+        y_idx = np.empty(n_pairs, np.int32)
+        max_idx = 1
+        for j in range(n_units):
+            u_idx[j] = _lit_idx(units[j])
+            max_idx = max(max_idx, u_idx[j])
+        for j in range(n_pairs):
+            p = pairs[j]
+            y = ((p + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+            x_idx[j] = _lit_idx(np.int32((p - y) >> 32))
+            y_idx[j] = _lit_idx(np.int32(y))
+            max_idx = max(max_idx, x_idx[j], y_idx[j])
+
+        # dense pair-aligned ids per problem, via a scratch map indexed by
+        # literal index that is wiped again after each problem
+        lit_map = np.empty((max_idx | 1) + 1, np.int32)
+        for i in range(lit_map.shape[0]):
+            lit_map[i] = -1
+        group = np.empty(n_max, np.int32)
+        src = np.empty(n_edges, np.int32)
+        dst = np.empty(n_edges, np.int32)
+        n = 0
+        m = 0
+        for g in range(n_prob):
+            for j in range(unit_ptr[g], unit_ptr[g + 1]):
+                li = u_idx[j]
+                if lit_map[li] == -1:
+                    lit_map[li] = n
+                    lit_map[li ^ 1] = n + 1
+                    group[n] = g
+                    group[n + 1] = g
+                    n += 2
+                a = lit_map[li]
+                src[m] = a ^ 1  # If not x, then x
+                dst[m] = a
+                m += 1
+            for j in range(pair_ptr[g], pair_ptr[g + 1]):
+                li = x_idx[j]
+                if lit_map[li] == -1:
+                    lit_map[li] = n
+                    lit_map[li ^ 1] = n + 1
+                    group[n] = g
+                    group[n + 1] = g
+                    n += 2
+                a = lit_map[li]
+                li = y_idx[j]
+                if lit_map[li] == -1:
+                    lit_map[li] = n
+                    lit_map[li ^ 1] = n + 1
+                    group[n] = g
+                    group[n + 1] = g
+                    n += 2
+                b = lit_map[li]
+                src[m] = a ^ 1  # If not x, then y
+                dst[m] = b
+                src[m + 1] = b ^ 1  # If not y, then x
+                dst[m + 1] = a
+                m += 2
+            for j in range(unit_ptr[g], unit_ptr[g + 1]):
+                lit_map[u_idx[j]] = -1
+                lit_map[u_idx[j] ^ 1] = -1
+            for j in range(pair_ptr[g], pair_ptr[g + 1]):
+                lit_map[x_idx[j]] = -1
+                lit_map[x_idx[j] ^ 1] = -1
+                lit_map[y_idx[j]] = -1
+                lit_map[y_idx[j] ^ 1] = -1
+
+        # forward-star adjacency: head[v] is v's first edge, nxt[e] the next one
+        head = np.empty(n, np.int32)
+        for i in range(n):
+            head[i] = -1
+        nxt = np.empty(n_edges, np.int32)
+        for e in range(n_edges):
+            nxt[e] = head[src[e]]
+            head[src[e]] = e
+
+        index = np.empty(n, np.int32)
+        lowlink = np.empty(n, np.int32)
+        on_stack = np.empty(n, np.uint8)  # byte mask
+        comp = np.empty(n, np.int32)
+        scc_stack = np.empty(n, np.int32)
+        dfs_node = np.empty(n, np.int32)
+        dfs_edge = np.empty(n, np.int32)
+        for i in range(n):
+            index[i] = -1
+            on_stack[i] = 0
+            comp[i] = -1
+        undecided = n_prob
+        counter = 0
+        n_comp = 0
+        sp = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = counter
+            lowlink[root] = counter
+            counter += 1
+            scc_stack[sp] = root
+            sp += 1
+            on_stack[root] = 1
+            dfs_node[0] = root
+            dfs_edge[0] = head[root]
+            dp = 1
+            while dp > 0:
+                v = dfs_node[dp - 1]
+                e = dfs_edge[dp - 1]
+                if e != -1:
+                    dfs_edge[dp - 1] = nxt[e]
+                    w = dst[e]
+                    if index[w] == -1:
+                        index[w] = counter
+                        lowlink[w] = counter
+                        counter += 1
+                        scc_stack[sp] = w
+                        sp += 1
+                        on_stack[w] = 1
+                        dfs_node[dp] = w
+                        dfs_edge[dp] = head[w]
+                        dp += 1
+                    elif on_stack[w] == 1 and index[w] < lowlink[v]:
+                        lowlink[v] = index[w]
+                    continue
+
+                dp -= 1
+                if dp > 0:
+                    u = dfs_node[dp - 1]
+                    if lowlink[v] < lowlink[u]:
+                        lowlink[u] = lowlink[v]
+                if lowlink[v] == index[v]:
+                    while True:
+                        sp -= 1
+                        w = scc_stack[sp]
+                        on_stack[w] = 0
+                        comp[w] = n_comp
+                        if comp[w ^ 1] == n_comp and unsat[group[w]] == 0:
+                            unsat[group[w]] = 1
+                            undecided -= 1
+                            if undecided == 0:
+                                return
+                        if w == v:
+                            break
+                    n_comp += 1
+
+    # compile (or load from cache) now so the first solve() does not pay for it
+    _tarjan_2sat(np.array([1], np.int32), np.array([0, 1], np.int32), np.array([(-1 << 32) + 2], np.int64),
+                 np.array([0, 1], np.int32), np.zeros(1, np.uint8))
+else:
+    _tarjan_2sat = None
+
+
+# the graph libraries only back the opt-in two_sat_* reference implementations,
+# so they are imported on first use instead of on every import of this module
+_optional_modules = {}
+
+
+def _import_optional(name, needed_by=None):
+    """Imports an optional library once and caches it; None (or ImportError for needed_by) if missing."""
+    if name not in _optional_modules:
+        try:
+            _optional_modules[name] = importlib.import_module(name)
+        except ImportError:
+            _optional_modules[name] = None
+    module = _optional_modules[name]
+    if module is None and needed_by is not None:
+        raise ImportError("%s requires %s, which is not installed" % (needed_by, name))
+    return module
+
+
+def _pack(a, b):
+    """Packs the literal pair (a, b) into the single int a * 2**32 + b.
+
+    _unpack recovers b only from its low 32 bits, so b must lie in
+    [-2**31, 2**31); anything else raises OverflowError rather than packing
+    to a pair that decodes differently.
+    """
+    if not -0x80000000 <= b < 0x80000000:
+        raise OverflowError("literal %d does not fit a packed pair" % b)
+    return (a << 32) + b
+
+
+def _unpack(p):
+    """Inverse of _pack."""
+    b = ((p + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    return (p - b) >> 32, b
+
+
+def _dense(lit_id, x):
+    """Maps literal x through lit_id onto dense variables 1..k, numbering a new variable on first sight."""
+    if x not in lit_id:
+        i = (len(lit_id) >> 1) + 1
+        v = abs(x)
+        lit_id[v] = i
+        lit_id[-v] = -i
+    return lit_id[x]
+
+
+def _two_sat_fast(clauses):
+    """2-SAT test by iterative Tarjan SCC over dense integer literal ids.
+
+    Literals may be any ints: they are renumbered densely before packing,
+    which keeps them inside _pack's range and the kernel's literal map small.
+    """
+    lit_id = {}
+    units = [_dense(lit_id, clause[0]) for clause in clauses if len(clause) == 1]
+    pairs = [_pack(_dense(lit_id, clause[0]), _dense(lit_id, clause[1]))
+             for clause in clauses if len(clause) == 2]
+    return _two_sat_batch([(units, pairs)])[0]
+
+
+_PACKED_MAX = _pack(2**31 - 1, 2**31 - 1)
+
+
+def _kernel_literals(units, pairs):
+    """Units and packed pairs as the int32/int64 arrays _tarjan_2sat takes.
+
+    The kernel sizes its literal map by the largest literal and needs
+    |v| <= _KERNEL_MAX_LIT, so when any literal exceeds the number of
+    literals in the batch (sparse or huge), all of them are renumbered to
+    dense variables first; renaming variables does not change any verdict.
+    Raises OverflowError for literals that do not fit, which the caller
+    hands to the Python path.
+    """
+    units = np.array(units, np.int64)
+    pairs = np.array(pairs, np.int64)
+    if pairs.size and pairs.max() > _PACKED_MAX:
+        # the first literal is past int32, which the vectorized decode would wrap
+        raise OverflowError("packed pair out of range")
+    lo = ((pairs + 0x80000000) & 0xFFFFFFFF) - 0x80000000  # _unpack, vectorized
+    hi = (pairs - lo) >> 32
+    lits = np.concatenate((units, hi, lo))
+    if lits.size > _KERNEL_MAX_LIT:
+        # even dense variables could pass the kernel's int32 literal indices
+        raise OverflowError("too many literals for the Numba kernel")
+    if lits.size and (lits.min() < -lits.size or lits.max() > lits.size):
+        _, var = np.unique(np.abs(lits), return_inverse=True)
+        lits = np.where(lits < 0, -1, 1) * (var.reshape(-1) + 1)
+        n_units, n_pairs = units.size, pairs.size
+        units = lits[:n_units]
+        pairs = (lits[n_units:n_units + n_pairs] << 32) + lits[n_units + n_pairs:]
+    return units.astype(np.int32), pairs
+
+
+def _two_sat_batch(problems):
+    """Runs several independent 2-SAT tests as one disjoint graph and a single SCC pass.
+
+    Each problem is (units, pairs): unit clauses plus binary clauses packed
+    into ints by _pack.  Each problem gets its own range of literal ids, so no
+    edge crosses between problems; returns one SAT/UNSAT bool per problem.
+    """
+
+    sat = [True] * len(problems)
+
+    # skip the graph for the shapes that decide themselves: at most one clause
+    # is always SAT, and units alone are UNSAT iff some x and -x both occur
+    hard = []
+    for g, (units, pairs) in enumerate(problems):
+        if len(units) + len(pairs) <= 1:
+            continue
+        if not pairs:
+            seen = set(units)
+            sat[g] = not any(-x in seen for x in seen)
+            continue
+        hard.append(g)
+    if not hard:
+        return sat
+
+    if _tarjan_2sat is not None:
+        # flatten the problems; ids, edges and SCCs are all done in native code
+        units_all = []
+        pairs_all = []
+        unit_ptr = [0]
+        pair_ptr = [0]
+        for g in hard:
+            units, pairs = problems[g]
+            units_all += units
+            pairs_all += pairs
+            unit_ptr.append(len(units_all))
+            pair_ptr.append(len(pairs_all))
+        try:
+            units_all, pairs_all = _kernel_literals(units_all, pairs_all)
+        except OverflowError:
+            pass  # a literal beyond int64; the dict-based path below takes any int
+        else:
+            unsat = np.zeros(len(hard), np.uint8)
+            _tarjan_2sat(units_all, np.array(unit_ptr, np.int32),
+                         pairs_all, np.array(pair_ptr, np.int32), unsat)
+            for g, u in zip(hard, unsat):
+                sat[g] = not u
+            return sat
+
+    # literal -> dense id per problem; x and -x get the pair (2j, 2j + 1),
+    # so the negation of id i is always i ^ 1
+    group = []
+    adj = []
+    for h, g in enumerate(hard):
+        units, pairs = problems[g]
+        pairs = [_unpack(p) for p in pairs]
+        lit_id = {}
+        for lits in (units, *pairs):
+            for x in lits:
+                if x not in lit_id:
+                    i = len(group)
+                    lit_id[x] = i
+                    lit_id[-x] = i + 1
+                    group.append(h)
+                    group.append(h)
+                    adj.append(set())
+                    adj.append(set())
+
+        # adjacency sets drop repeated edges; a unit needs only -x -> x, no self-loop
+        for x in units:
+            adj[lit_id[-x]].add(lit_id[x])  # If not x, then x
+        for x, y in pairs:
+            adj[lit_id[-x]].add(lit_id[y])  # If not x, then y
+            adj[lit_id[-y]].add(lit_id[x])  # If not y, then x
+
+    unsat = [0] * len(hard)
+    _tarjan_2sat_py([list(edges) for edges in adj], group, unsat)
+    for g, u in zip(hard, unsat):
+        sat[g] = not u
+    return sat
+
+
+def _tarjan_2sat_py(adj, group, unsat):
+    """Pure-Python iterative Tarjan; sets unsat[g] when a literal of problem g shares an SCC with its negation."""
+
+    n = len(group)
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = [0] * n
+    comp_id = [-1] * n
+    scc_stack = []
+    undecided = len(unsat)
+    counter = 0
+    n_comp = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        # explicit DFS stack of (node, next edge position) instead of recursion
+        index_stack = [root]
+        edge_pos = [0]
+        while index_stack:
+            v = index_stack[-1]
+            i = edge_pos[-1]
+            edges = adj[v]
+            if i < len(edges):
+                edge_pos[-1] = i + 1
+                w = edges[i]
+                if index[w] == -1:
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    scc_stack.append(w)
+                    on_stack[w] = 1
+                    index_stack.append(w)
+                    edge_pos.append(0)
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+                continue
+
+            index_stack.pop()
+            edge_pos.pop()
+            if index_stack:
+                u = index_stack[-1]
+                if lowlink[v] < lowlink[u]:
+                    lowlink[u] = lowlink[v]
+            if lowlink[v] == index[v]:
+                # pop the SCC; a literal and its negation in it means UNSAT
+                while True:
+                    w = scc_stack.pop()
+                    on_stack[w] = 0
+                    comp_id[w] = n_comp
+                    if comp_id[w ^ 1] == n_comp and not unsat[group[w]]:
+                        unsat[group[w]] = 1
+                        undecided -= 1
+                        if undecided == 0:
+                            return
+                    if w == v:
+                        break
+                n_comp += 1
+
 
 class FastThreeSATSolver:
 
+    TWO_SAT_CACHE_SIZE = 1 << 16  # memoized 2-SAT verdicts kept per TwoSATSets
+    BRUTE_FORCE_MAX_VARS = 24  # 2 ** 24-bit tables, 2 MB per literal
+    NUMPY_MIN_CLAUSES = 64  # below this, converting to an ndarray costs more than it saves
+
     class TwoSATSets:
         def __init__(self):
+            # flat implication records, one per literal of each clause:
+            # fwd_src -> fwd_pair and bkw_pair -> bkw_imp, with pairs packed by _pack
+            self.fwd_src = array('i')
+            self.fwd_pair = array('q')
+            self.bkw_pair = array('q')
+            self.bkw_imp = array('i')
+            self.n_bucketed = 0  # records already grouped into sets_fwd/sets_bkw
             self.sets_fwd = {}
             self.sets_bkw = {}  # this coauses duplicates
-            self.unsat_pos = set()
-            self.unsat_neg = set()
+            self.unsat_units = set()  # literals forced by a key k whose 2-SAT failed, i.e. -k
             self.unsat_tup = set()
+            self._two_sat_cache = {}
+            # input literal -> literal over dense variables 1..k, numbered as they appear
+            self.lit_id = {}
+            # keys touched since the last find_unsat; the others keep their verdicts
+            self.dirty_fwd = set()
+            self.dirty_bkw = set()
+
+        def reset(self):
+            """Empties every container in place so the instance can be reused."""
+            for records in (self.fwd_src, self.fwd_pair, self.bkw_pair, self.bkw_imp):
+                del records[:]
+            self.n_bucketed = 0
+            self.sets_fwd.clear()
+            self.sets_bkw.clear()
+            self.unsat_units.clear()
+            self.unsat_tup.clear()
+            self._two_sat_cache.clear()
+            self.lit_id.clear()
+            self.dirty_fwd.clear()
+            self.dirty_bkw.clear()
+
+        def dense(self, x):
+            """Maps an input literal onto the dense variable range, numbering a new variable on first sight."""
+            return _dense(self.lit_id, x)
             
+        def two_sat_batch(self, problems):
+            """FastThreeSATSolver.two_sat_batch memoized on the (canonical) set of clauses."""
+            cache = self._two_sat_cache
+            keys = [(frozenset(units), frozenset(pairs)) for units, pairs in problems]
+            # each distinct uncached problem goes into the batch once
+            misses = {}
+            for key, problem in zip(keys, problems):
+                if key not in cache and key not in misses:
+                    misses[key] = problem
+            if not misses:
+                return [cache[key] for key in keys]
+            results = FastThreeSATSolver.two_sat_batch(list(misses.values()))
+            cache.update(zip(misses, results))
+            verdicts = [cache[key] for key in keys]
+            # dicts keep insertion order, so evicting from the front is FIFO
+            excess = len(cache) - FastThreeSATSolver.TWO_SAT_CACHE_SIZE
+            if excess > 0:
+                for key in list(itertools.islice(cache, excess)):
+                    del cache[key]
+            return verdicts
+
         def append(self, tup):
-            if -tup[0] not in self.sets_fwd:
-                self.sets_fwd[-tup[0]] = set()
-            self.sets_fwd[-tup[0]].add(FastThreeSATSolver.normalize_tuple((tup[1], tup[2])))
-            if -tup[1] not in self.sets_fwd:
-                self.sets_fwd[-tup[1]] = set()
-            self.sets_fwd[-tup[1]].add(FastThreeSATSolver.normalize_tuple((tup[0], tup[2])))
-            if -tup[2] not in self.sets_fwd:
-                self.sets_fwd[-tup[2]] = set()
-            self.sets_fwd[-tup[2]].add(FastThreeSATSolver.normalize_tuple((tup[0], tup[1])))
-            
-            this_tup = FastThreeSATSolver.normalize_tuple((-tup[1], -tup[2]))
-            if this_tup not in self.sets_bkw:
-                self.sets_bkw[this_tup] = set()
-            self.sets_bkw[this_tup].add(tup[0])
+            # sparse or huge variable ids would otherwise size the literal maps
+            lit_id = self.lit_id
+            try:
+                a, b, c = lit_id[tup[0]], lit_id[tup[1]], lit_id[tup[2]]
+            except KeyError:
+                a, b, c = map(self.dense, tup)
+            # for each literal x and the other two y, z: -x -> (y, z) and (-y, -z) -> x
+            for x, y, z in ((a, b, c), (b, a, c), (c, a, b)):
+                if y > z:
+                    y, z = z, y
+                self.fwd_src.append(-x)
+                self.fwd_pair.append((y << 32) + z)  # _pack(y, z), inlined
+                self.bkw_pair.append((-z << 32) - y)  # _pack(-z, -y)
+                self.bkw_imp.append(x)
 
+        def extend(self, rows):
+            """Appends the records of many clauses at once (numpy path of append).
 
-            this_tup = FastThreeSATSolver.normalize_tuple((-tup[0], -tup[1]))
-            if this_tup not in self.sets_bkw:
-                self.sets_bkw[this_tup] = set()
-            self.sets_bkw[this_tup].add(tup[2])
-            
-            this_tup = FastThreeSATSolver.normalize_tuple((-tup[0], -tup[2]))
-            if this_tup not in self.sets_bkw:
-                self.sets_bkw[this_tup] = set()
-            self.sets_bkw[this_tup].add(tup[1])
+            rows is an (M, 3) integer ndarray.  Its literals are mapped through
+            dense(), then each row is sorted and repeated rows are dropped, so for
+            x = row[i] the other two literals are already in (y, z) order.
+            """
+            lits, inv = np.unique(rows, return_inverse=True)
+            dense = np.array([self.dense(int(x)) for x in lits], np.int64)
+            rows = np.unique(np.sort(dense[inv].reshape(rows.shape), axis=1), axis=0)
+            lo, mid, hi = rows[:, 0], rows[:, 1], rows[:, 2]
+            x = rows.ravel()
+            y = np.stack((mid, lo, lo), axis=1).ravel()
+            z = np.stack((hi, hi, mid), axis=1).ravel()
+            self.fwd_src.frombytes((-x).astype(np.int32).tobytes())
+            self.fwd_pair.frombytes(((y << 32) + z).tobytes())
+            self.bkw_pair.frombytes(((-z << 32) - y).tobytes())
+            self.bkw_imp.frombytes(x.astype(np.int32).tobytes())
+
+        def bucket(self):
+            """Groups the records appended since the last call into sets_fwd/sets_bkw.
+
+            sets_fwd[-x] lists the packed pairs implied by -x and sets_bkw is keyed
+            by packed pair; every key that receives a record is marked dirty.
+            """
+            start = self.n_bucketed
+            fwd = self.sets_fwd
+            for k, p in zip(self.fwd_src[start:], self.fwd_pair[start:]):
+                if k in fwd:
+                    fwd[k].append(p)
+                else:
+                    fwd[k] = [p]
+            self.dirty_fwd.update(self.fwd_src[start:])
+
+            bkw = self.sets_bkw
+            keys = self.bkw_pair[start:]
+            for k, x in zip(keys, self.bkw_imp[start:]):
+                if k in bkw:
+                    bkw[k].add(x)
+                else:
+                    bkw[k] = {x}
+            self.dirty_bkw.update(keys)
+            self.n_bucketed = len(self.fwd_src)
             
         def find_unsat(self):
-            for k, v in self.sets_fwd.items():
-                if not FastThreeSATSolver.two_sat(v):
-                    if k > 0:
-                        self.unsat_pos.add(k)
-                    else:
-                        self.unsat_neg.add(-k)
+            """Re-checks only the keys whose 2-SAT problem changed since the last call.
+
+            Clauses are only ever added, so a key found UNSAT stays UNSAT and an
+            untouched key keeps its previous verdict.
+            """
+            self.bucket()
+            self._two_sat_cache.clear()
+            dirty_fwd = self.dirty_fwd
+            unsat_units = self.unsat_units
+            # all forward checks in one SCC pass, then all backward checks in another;
+            # keys already found UNSAT stay UNSAT and need no re-check
+            keys = [k for k in dirty_fwd if -k not in unsat_units]
+            problems = [((), self.sets_fwd[k]) for k in keys]
+            for k, sat in zip(keys, self.two_sat_batch(problems)):
+                if not sat:
+                    unsat_units.add(-k)
+                    if k in unsat_units:
+                        # both k and -k are forced; what is still dirty stays dirty
+                        return True
     
+            keys = []
+            problems = []
+            forced = []
+            sets_fwd = self.sets_fwd
+            dirty_bkw = self.dirty_bkw
             for k, vv in self.sets_bkw.items():
-                targets = [k]
-                added = False
+                if k not in dirty_bkw and dirty_fwd.isdisjoint(vv):
+                    continue
+                # -v forced means v's own forward check was UNSAT; this problem
+                # holds all of its clauses, so it is UNSAT without an SCC pass
+                if unsat_units and any(-v in unsat_units for v in vv):
+                    forced.append(k)
+                    continue
+                pairs = [k]
                 for v in vv:
-                    targets.append((v,))
-                    if v in self.sets_fwd:
-                        targets += list(self.sets_fwd[v])
-                if not FastThreeSATSolver.two_sat(targets):
-                    self.unsat_tup.add((-k[1], -k[0]))
+                    if v in sets_fwd:
+                        pairs += sets_fwd[v]
+                keys.append(k)
+                problems.append((vv, pairs))
+            verdicts = self.two_sat_batch(problems)
+            for k, sat in zip(keys + forced, verdicts + [False] * len(forced)):
+                if not sat:
+                    k0, k1 = _unpack(k)
+                    self.unsat_tup.add(_pack(-k1, -k0))
+                    if k0 in unsat_units and k1 in unsat_units:
+                        # (-k1 or -k0) against the units k0 and k1
+                        return True
+            self.dirty_fwd.clear()
+            self.dirty_bkw.clear()
                     
-            two_sat_cond = []
-            for p in self.unsat_pos:
-                two_sat_cond.append((-p,))
-            for n in self.unsat_neg:
-                two_sat_cond.append((n,))
+            units = set(unsat_units)
 
-            two_sat_cond += list(self.unsat_tup)
-            
-            if not FastThreeSATSolver.two_sat(two_sat_cond):
+            # absorption: (a or b) is redundant next to the unit (a); pairs stay
+            # packed, keyed to their literals so they are unpacked only once
+            pairs = {}
+            for p in self.unsat_tup:
+                a, b = _unpack(p)
+                if a not in units and b not in units:
+                    pairs[p] = (a, b)
+            # (a or b) and (a or -b) == (a)
+            for a, b in pairs.values():
+                if ((a << 32) - b if a < -b else (-b << 32) + a) in pairs:  # _pack(a, -b)
+                    units.add(a)
+                if ((-a << 32) + b if -a < b else (b << 32) - a) in pairs:  # _pack(-a, b)
+                    units.add(b)
+            pairs = [p for p, (a, b) in pairs.items() if a not in units and b not in units]
+
+            if not FastThreeSATSolver.two_sat_batch([(units, pairs)])[0]:
                 return True
             else:
                 return False
     
     def __init__(self):
         self.twosat_sets = FastThreeSATSolver.TwoSATSets()
+
+    def reset(self):
+        """Forgets all clauses added so far, reusing the existing containers."""
+        self.twosat_sets.reset()
+
+    @classmethod
+    def solve_many(cls, clauses_list, verbose=False):
+        """Solves each clause list independently with one solver instance, reset between solves."""
+        solver = cls()
+        results = []
+        for clauses in clauses_list:
+            solver.reset()
+            results.append(solver.solve(clauses, verbose))
+        return results
         
+    @staticmethod
     def normalize_tuple(pair):
         """Ensures that (x, y) is always stored in sorted order."""
         if len(pair) == 1:
@@ -121,33 +695,204 @@ class FastThreeSATSolver:
     def add_clause(self, clause):
         """Processes a new 3-SAT clause (a, b, c)."""
 
+        if len(clause) != 3:
+            raise ValueError("expected a 3-literal clause, got %r" % (clause,))
         self.twosat_sets.append(clause)
 
-    def solve(self, clauses):
-        """Processes all clauses and determines SAT/UNSAT."""
-        
-        variables = sorted(set([abs(v) for vv in clauses for v in vv]))
+    def add_clauses(self, clauses):
+        """Processes many 3-SAT clauses (a list of triples or an (M, 3) integer ndarray), skipping repeats within the batch.
 
+        Raises ValueError for any other clause length or array shape, before adding anything.
+        """
+
+        # a repeated clause (in any literal order) adds nothing but six redundant inserts
+        if np is not None and (isinstance(clauses, np.ndarray)
+                               or len(clauses) >= FastThreeSATSolver.NUMPY_MIN_CLAUSES):
+            # an ndarray is already laid out for the vectorized path, whatever its size
+            if isinstance(clauses, np.ndarray):
+                if clauses.size == 0:
+                    return  # e.g. np.array([]), no clauses
+                if clauses.dtype.kind not in 'iu':
+                    # casting would silently truncate float literals
+                    raise ValueError("expected an integer array of clauses, got dtype %s" % clauses.dtype)
+                if clauses.ndim != 2 or clauses.shape[1] != 3:
+                    raise ValueError("expected 3-literal clauses, got shape %s" % (clauses.shape,))
+                if clauses.dtype.kind == 'u' and clauses.max() > np.iinfo(np.int64).max:
+                    # casting would wrap these ids negative; as Python ints they overflow below
+                    clauses = clauses.tolist()
+            try:
+                rows = np.asarray(clauses, dtype=np.int64)
+            except OverflowError:
+                rows = None  # an id beyond int64; the per-clause loop below takes any int
+            except ValueError:
+                raise ValueError("expected 3-literal clauses, got ragged rows") from None
+            if rows is not None:
+                if rows.ndim != 2 or rows.shape[1] != 3:
+                    raise ValueError("expected 3-literal clauses, got shape %s" % (rows.shape,))
+                self.twosat_sets.extend(rows)
+                return
+        # check the whole batch first so a bad clause leaves nothing half-added
+        for clause in clauses:
+            if len(clause) != 3:
+                raise ValueError("expected 3-literal clauses, got %r" % (clause,))
+        seen = set()
         for clause in clauses:
-            self.add_clause(clause)
+            key = tuple(sorted(clause))
+            if key not in seen:
+                seen.add(key)
+                self.twosat_sets.append(clause)
+
+    def solve(self, clauses, verbose=False):
+        """Processes all clauses (list or (M, 3) ndarray) and determines SAT/UNSAT (printed too if verbose)."""
+
+        self.add_clauses(clauses)
 
         if self.twosat_sets.find_unsat():
-            print("UNSAT")
+            if verbose:
+                print("UNSAT")
             return False
         else:
-            print("SAT")
+            if verbose:
+                print("SAT")
             return True
 
-    # use networkx
+    @staticmethod
     def two_sat(clauses):
+        """Returns False iff the 1/2-literal clauses are unsatisfiable."""
+        return _two_sat_fast(clauses)
+
+    @staticmethod
+    def two_sat_batch(problems):
+        """Runs two_sat on each (units, packed pairs) problem, sharing one graph build and SCC pass.
+
+        Pairs are packed by _pack, so their second literal must lie in [-2**31, 2**31);
+        unlike two_sat, literals are used as given rather than renumbered.
+        """
+        return _two_sat_batch(problems)
+
+    @staticmethod
+    def brute_force(clauses):
+        """Exact SAT test of any CNF by checking all 2**n assignments at once (opt-in, not used by solve).
+
+        Bit j of a variable's table is its value under assignment j, so a clause
+        is the OR of its literals' tables and the formula is the AND of those.
+        """
+        variables = sorted({abs(x) for clause in clauses for x in clause})
+        if len(variables) > FastThreeSATSolver.BRUTE_FORCE_MAX_VARS:
+            raise ValueError("brute_force supports at most %d variables, got %d"
+                             % (FastThreeSATSolver.BRUTE_FORCE_MAX_VARS, len(variables)))
+        n_assign = 1 << len(variables)
+        full = (1 << n_assign) - 1
+        table = {}
+        for i, v in enumerate(variables):
+            # v is true in the upper half of every block of 2 ** (i + 1) assignments
+            half = 1 << i
+            t = ((1 << half) - 1) << half
+            width = half << 1
+            while width < n_assign:
+                t |= t << width
+                width <<= 1
+            table[v] = t
+            table[-v] = full ^ t
+        sat = full
+        for clause in clauses:
+            c = 0
+            for x in clause:
+                c |= table[x]
+            sat &= c
+            if not sat:
+                return False
+        return True
+
+    # graph-library reference implementations (both libraries are optional)
+    @staticmethod
+    def two_sat_graph(clauses):
+        """two_sat via rustworkx's Rust SCC when installed, else scipy's C SCC, else networkx."""
+        if _import_optional('rustworkx') is not None:
+            return FastThreeSATSolver.two_sat_rx(clauses)
+        if _import_optional('scipy.sparse.csgraph') is not None:
+            return FastThreeSATSolver.two_sat_scipy(clauses)
+        if _import_optional('networkx') is not None:
+            return FastThreeSATSolver.two_sat_nx(clauses)
+        raise ImportError("two_sat_graph requires rustworkx, scipy or networkx; none is installed")
+
+    @staticmethod
+    def two_sat_rx(clauses):
+
+        rx = _import_optional('rustworkx', 'two_sat_rx')
+        G = rx.PyDiGraph()
+        lit2idx = {}
+
+        def node(x):
+            if x not in lit2idx:
+                lit2idx[x] = G.add_node(x)
+            return lit2idx[x]
+
+        edges = []
+        for clause in clauses:
+            if len(clause) == 1:
+                x = clause[0]
+                edges.append((node(-x), node(x)))  # If not x, then x
+            elif len(clause) == 2:
+                x, y = clause
+                edges.append((node(-x), node(y)))  # If not x, then y
+                edges.append((node(-y), node(x)))  # If not y, then x
+        G.add_edges_from_no_data(edges)
+
+        # Map nodes to their SCC index, then look for a variable and its negation in one SCC
+        node_to_scc = {}
+        for i, comp in enumerate(rx.strongly_connected_components(G)):
+            for idx in comp:
+                node_to_scc[G[idx]] = i
+        for var, i in node_to_scc.items():
+            if var > 0 and node_to_scc.get(-var) == i:
+                return False  # UNSAT
+
+        return True  # SAT
+
+    @staticmethod
+    def two_sat_scipy(clauses):
 
+        csgraph = _import_optional('scipy.sparse.csgraph', 'two_sat_scipy')
+        sparse = _import_optional('scipy.sparse', 'two_sat_scipy')
+
+        # x and -x get the ids (2j, 2j + 1), so the negation of id i is i ^ 1
+        lit_id = {}
+        for clause in clauses:
+            for x in clause:
+                if x not in lit_id:
+                    lit_id[x] = len(lit_id)
+                    lit_id[-x] = len(lit_id)
+        src = []
+        dst = []
+        for clause in clauses:
+            if len(clause) == 1:
+                x = lit_id[clause[0]]
+                src.append(x ^ 1)  # If not x, then x
+                dst.append(x)
+            elif len(clause) == 2:
+                x, y = lit_id[clause[0]], lit_id[clause[1]]
+                src += (x ^ 1, y ^ 1)  # If not x, then y; if not y, then x
+                dst += (y, x)
+        if not src:
+            return True
+
+        n = len(lit_id)
+        M = sparse.coo_matrix((np.ones(len(src), np.int8), (src, dst)), shape=(n, n)).tocsr()
+        _, labels = csgraph.connected_components(M, directed=True, connection='strong')
+        # UNSAT iff some literal shares an SCC with its negation
+        return not (labels[0::2] == labels[1::2]).any()
+
+    @staticmethod
+    def two_sat_nx(clauses):
+
+        nx = _import_optional('networkx', 'two_sat_nx')
         G = nx.DiGraph()
         
         for clause in clauses:
             if len(clause) == 1:
                 x = clause[0]
                 G.add_edge(-x, x)  # Implication: If not x, then x (contradiction)
-                G.add_edge(x, x)    # Maintain consistency for the unit clause
             elif len(clause) == 2:
                 x, y = clause
                 G.add_edge(-x, y)  # If not x, then y
@@ -160,90 +905,72 @@ class FastThreeSATSolver:
         node_to_scc = {node: i for i, comp in enumerate(scc) for node in comp}
         
         # Check for contradictions: a variable and its negation in the same SCC
-        for var in G.nodes():
-            if -var in G.nodes() and node_to_scc[var] == node_to_scc[-var]:
-                return False  # UNSAT
+        # (checking the positive literal of each pair is enough)
+        for var in node_to_scc:
+            if var > 0:
+                neg = -var
+                if neg in node_to_scc and node_to_scc[var] == node_to_scc[neg]:
+                    return False  # UNSAT
         
         return True  # SAT
 
-    # no graph
-    # def two_sat2(clauses):
-    #     # Extract all variables from clauses
-    #     variables = set(abs(var) for clause in clauses for var in clause)
-        
-    #     # Generate all possible truth assignments (1=True, -1=False)
-    #     for assignment in product([True, False], repeat=len(variables)):
-    #         # Map variable to its truth value
-    #         assignment_dict = {var: value for var, value in zip(sorted(variables), assignment)}
-            
-    #         # Evaluate all clauses
-    #         if all(any((lit > 0 and assignment_dict[abs(lit)]) or (lit < 0 and not assignment_dict[abs(lit)]) for lit in clause) for clause in clauses):
-    #             # Found a satisfying assignment
-    #             model = {var: assignment_dict[var] for var in variables}
-    #             is_satisfiable = True
-    #             break
-    #     else:
-    #         # No satisfying assignment found
-    #         model = None
-    #         is_satisfiable = False
-    #     return is_satisfiable
-
-# Example CNF (3-SAT clauses)
-
-# UNSAT Compact Test
-print("  =============")
-print("COMPACT TEST UNSAT")
-clauses = [
-           (-4, -1, 3), 
-           (-3, -2, -1), 
-           (-4, 1, 3), 
-           (-2, -1, 4), 
-           (-4, -2, 1), 
-           (1, 2, 4), 
-           (-1, 2, 3), 
-           (-4, -3, 2), 
-           (-3, -1, 4), 
-           (-2, 1, 4), 
-          ]
-
-print(FastThreeSATSolver().solve(clauses))
-
-# # SAT
-print("  =============")
-print("TEST SAT")
-clauses_set =  [
-    [(-4, 1, 3), (-4, -3, -2), (-4, -3, -1), (-4, -2, 3), (-4, -2, 3), (-3, 1, 4), (-3, -2, 4), (-3, 1, 2), (-4, 1, 2), (-3, -2, -1), (-4, 1, 2), (-2, 1, 4), (1, 3, 4), (-4, -1, 3), (-3, -1, 2), (1, 2, 4), (-2, -1, 4), (-2, 3, 4), (-3, -2, 4), (-3, 1, 2)],
-    [(-4, -3, -2), (-4, 1, 3), (-1, 3, 4), (-3, 2, 4), (1, 2, 4), (-4, 1, 3), (-4, -3, -2), (-4, -3, -2), (1, 3, 4), (1, 2, 3), (-3, -2, -1), (-3, -2, 4), (-3, 1, 4), (-4, 1, 3), (-4, 2, 3), (-4, -2, -1), (-3, 2, 4), (-4, -3, -2), (-4, -3, -2), (-4, -2, 3)],
-    [(-1, 2, 4), (-2, -1, 4), (-3, -2, -1), (-1, 2, 4), (-2, -1, 4), (2, 3, 4), (-3, 2, 4), (-3, -1, 2), (-3, 2, 4), (2, 3, 4), (-4, -2, -1), (-2, -1, 3), (-3, 2, 4), (-3, 1, 4), (-4, -2, -1), (2, 3, 4), (-3, -1, 2), (-4, -2, 3), (-3, -1, 4), (-1, 3, 4)],
-    [(-4, -3, 2), (-1, 2, 3), (-3, -2, 1), (-2, 3, 4), (-4, -3, 2), (-2, 1, 4), (-4, -3, -2), (-2, 1, 3), (-2, -1, 4), (-4, -3, 2), (-3, -1, 2), (-4, -3, 1), (-4, 1, 3), (-2, -1, 3), (-3, -1, 2), (-4, -1, 2), (-2, 1, 4), (-3, -2, -1), (-1, 2, 3), (-4, -3, -1)],
-    [(-4, -3, 2), (1, 2, 3), (-4, -3, 2), (-4, -2, -1), (-3, -2, 4), (-2, 1, 3), (-3, -2, -1), (-4, -1, 3), (-4, 1, 3), (-1, 2, 3), (-3, -1, 2), (-3, 2, 4), (1, 2, 3), (-2, 3, 4), (1, 3, 4), (-3, 1, 4), (-3, -2, -1), (1, 2, 4), (-4, 1, 2), (-4, -1, 2)],
-    [(-3, 1, 2), (-2, 1, 3), (2, 3, 4), (-4, 1, 2), (-2, 1, 4), (-3, -1, 2), (1, 3, 4), (-4, 2, 3), (-4, -2, 3), (-4, -3, 2), (-3, 1, 2), (-4, -1, 2), (-4, -3, -2), (-2, -1, 3), (1, 2, 4), (-1, 2, 4), (-4, 2, 3), (-2, 1, 3), (-4, -2, -1), (-2, -1, 3)],
-    [(2, 3, 4), (-3, -2, 1), (-3, 2, 4), (-4, -3, -1), (-2, 1, 3), (-2, -1, 3), (-3, -2, 1), (-2, -1, 4), (-3, 1, 4), (-4, -3, -2), (-1, 2, 3), (-1, 3, 4), (-2, -1, 3), (-3, -1, 4), (-4, -1, 2), (-3, 1, 2), (-2, 1, 4), (1, 2, 4), (-3, 1, 2), (1, 3, 4)],
-    [(-4, -1, 3), (1, 3, 4), (-3, -1, 2), (-4, 1, 2), (-1, 2, 3), (2, 3, 4), (1, 3, 4), (-2, -1, 3), (-2, 1, 3), (-1, 3, 4), (-2, -1, 4), (-4, -3, 2), (-3, -2, 1), (-4, 1, 2), (-2, 1, 3), (-2, 3, 4), (-3, 2, 4), (-4, 1, 3), (-3, 1, 4), (-3, -1, 2)],
-    [(-4, -3, -2), (1, 2, 3), (-3, -2, 1), (1, 3, 4), (-1, 2, 4), (-3, -1, 2), (1, 3, 4), (-3, 1, 2), (-2, -1, 4), (-4, -2, -1), (2, 3, 4), (-1, 3, 4), (2, 3, 4), (-4, -2, -1), (-3, 2, 4), (1, 3, 4), (-4, -3, 2), (-4, -3, -1), (-4, -3, 1), (-4, -3, -1)],
-    [(-3, -1, 4), (-3, 1, 2), (-4, -2, 1), (1, 2, 3), (1, 2, 4), (1, 2, 4), (-2, 3, 4), (2, 3, 4), (-4, 1, 3), (1, 3, 4), (-4, -3, 2), (-4, 1, 3), (-4, 1, 2), (-3, -2, -1), (-3, -1, 4), (-2, -1, 3), (-3, -2, -1), (-4, 1, 2), (-4, -3, 2), (-3, -2, 4)],
-    [(-3, -1, 2), (-4, 2, 3), (-4, -3, 1), (-3, -1, 2), (-3, -2, 4), (-4, 1, 2), (-3, -2, -1), (-4, -1, 2), (-4, -1, 3), (-3, -2, 4), (-2, 1, 3), (-3, -1, 2), (-3, -2, 1), (-4, -3, 2), (1, 2, 3), (-2, 1, 3), (-2, -1, 3), (-1, 2, 4), (-3, -2, 1), (-3, -1, 2)]
-]
-for clauses in clauses_set:
-    print(FastThreeSATSolver().solve(clauses))
-
-
-
-# UNSAT Cases
-print("  =============")
-print("TEST UNSAT")
-clauses_set =  [
-    [(-4, -2, 1), (-4, 1, 3), (1, 2, 3), (-4, -3, 1), (-4, -1, 3), (-2, 3, 4), (-2, -1, 4), (-4, 1, 2), (-3, -1, 2), (-1, 2, 4), (-4, -2, -1), (-4, -1, 2), (-4, -3, -1), (-3, -2, 1), (1, 3, 4), (-3, 2, 4), (-4, -3, -2), (-4, -2, 1), (-4, -3, -2), (-4, -3, -1)],
-    [(-2, -1, 4), (1, 3, 4), (1, 2, 4), (-4, 1, 2), (-3, -2, -1), (-1, 2, 4), (-4, -3, -2), (-1, 2, 4), (-2, 3, 4), (1, 2, 4), (-4, -2, 1), (-4, -1, 2), (-4, -1, 3), (-4, -3, 2), (-4, -2, 3), (-3, -2, 4), (1, 2, 3), (-3, 1, 4), (-4, -3, 2), (-2, -1, 3)],
-    [(-2, 3, 4), (-2, -1, 3), (1, 2, 3), (-2, 1, 3), (-4, -2, 3), (-1, 2, 4), (-4, -3, 2), (-4, -3, -1), (-3, 1, 4), (1, 2, 3), (-3, -2, 4), (-4, 2, 3), (-4, -3, -2), (-3, -2, 1), (-2, -1, 4), (-4, -3, -1), (-4, -1, 2), (-3, -1, 2), (-3, -2, 4), (-4, -3, -2)],
-    [(-1, 2, 4), (-4, 1, 2), (-3, 1, 2), (-2, 3, 4), (2, 3, 4), (-4, -3, -1), (-4, -3, -1), (1, 2, 3), (-2, 1, 4), (-2, -1, 4), (-4, -2, -1), (-4, -1, 3), (2, 3, 4), (-4, 2, 3), (-4, -2, 3), (-3, -2, 1), (-3, -1, 4), (-1, 2, 3), (-2, 3, 4), (-2, 1, 4)],
-    [(-4, -3, 2), (-4, 1, 2), (-1, 2, 4), (-4, -3, -1), (-4, -2, 1), (-2, 3, 4), (-3, -2, 4), (1, 2, 4), (-2, 1, 4), (-4, -2, 1), (-2, 3, 4), (-2, 1, 4), (-3, 1, 2), (2, 3, 4), (-3, -2, -1), (-4, -1, 3), (-1, 3, 4), (-3, -2, 4), (-3, 2, 4), (-4, 1, 2)],
-    [(-3, -2, -1), (-3, 1, 2), (-1, 2, 4), (-3, -1, 4), (-2, -1, 3), (-4, -1, 2), (-4, 1, 2), (-4, -2, 3), (-4, -3, 2), (-3, 1, 2), (-4, 1, 3), (1, 2, 3), (-4, -3, 1), (-3, -2, 4), (-3, -2, 4), (-3, -1, 4), (-3, -1, 2), (1, 2, 4), (-3, 2, 4), (-2, 1, 4)],
-    [(-2, 1, 4), (-4, 1, 2), (-3, -2, 4), (-3, -2, 4), (-4, -3, 1), (-4, 1, 2), (-4, -3, -1), (-4, -2, -1), (-4, -2, 3), (-1, 3, 4), (-4, -3, -1), (1, 2, 3), (-4, -3, -1), (1, 2, 4), (-3, 2, 4), (-4, -3, -1), (-4, 2, 3), (-4, 1, 2), (2, 3, 4), (-2, 3, 4)],
-    [(-3, -2, 4), (-1, 2, 4), (-2, 3, 4), (1, 2, 4), (-3, -1, 4), (-4, -3, 2), (-3, -1, 2), (-4, -3, 2), (-4, -3, 1), (2, 3, 4), (-2, -1, 4), (-4, -2, -1), (-1, 2, 3), (-3, -1, 2), (-4, -1, 3), (-4, -1, 3), (-4, -2, 1), (-4, -1, 3), (-4, 1, 2), (-2, 3, 4)],
-    [(-4, -3, 2), (2, 3, 4), (-4, -3, 2), (-4, -3, -2), (2, 3, 4), (-3, 1, 2), (-4, -3, -2), (-1, 3, 4), (-3, -2, 1), (-3, -2, 4), (-4, 2, 3), (-1, 2, 3), (-3, -1, 2), (-2, -1, 4), (-3, 1, 2), (-2, 1, 3), (-1, 2, 4), (-2, -1, 3), (-2, -1, 4), (-2, 1, 3)],
-    [(-4, -3, 1), (1, 2, 3), (-4, -2, 1), (-4, -2, 1), (-2, 1, 3), (-4, 1, 3), (-4, -3, -2), (-3, -2, 4), (-2, -1, 4), (-4, -2, 1), (-1, 3, 4), (-4, -1, 3), (-1, 2, 4), (1, 2, 3), (1, 2, 4), (-2, 1, 4), (1, 2, 4), (-3, -1, 2), (-4, 1, 3), (-2, 3, 4)],
-    [(-3, -2, 1), (-4, 2, 3), (-2, 1, 3), (-1, 2, 4), (-3, -2, 1), (-2, -1, 4), (1, 3, 4), (-3, -1, 2), (-4, -1, 2), (-4, -3, 2), (-3, -1, 2), (-2, -1, 4), (-3, 2, 4), (-4, -2, -1), (-2, -1, 3), (-2, 1, 3), (-3, -1, 4), (-4, -1, 2), (-2, 1, 3), (-4, 1, 3)]
-]
-for clauses in clauses_set:
-    print(FastThreeSATSolver().solve(clauses))
+if __name__ == "__main__":
+    # Example CNF (3-SAT clauses)
+
+    # UNSAT Compact Test
+    print("  =============")
+    print("COMPACT TEST UNSAT")
+    clauses = [
+               (-4, -1, 3), 
+               (-3, -2, -1), 
+               (-4, 1, 3), 
+               (-2, -1, 4), 
+               (-4, -2, 1), 
+               (1, 2, 4), 
+               (-1, 2, 3), 
+               (-4, -3, 2), 
+               (-3, -1, 4), 
+               (-2, 1, 4), 
+              ]
+
+    print(FastThreeSATSolver().solve(clauses, verbose=True))
+
+    # # SAT
+    print("  =============")
+    print("TEST SAT")
+    clauses_set =  [
+        [(-4, 1, 3), (-4, -3, -2), (-4, -3, -1), (-4, -2, 3), (-4, -2, 3), (-3, 1, 4), (-3, -2, 4), (-3, 1, 2), (-4, 1, 2), (-3, -2, -1), (-4, 1, 2), (-2, 1, 4), (1, 3, 4), (-4, -1, 3), (-3, -1, 2), (1, 2, 4), (-2, -1, 4), (-2, 3, 4), (-3, -2, 4), (-3, 1, 2)],
+        [(-4, -3, -2), (-4, 1, 3), (-1, 3, 4), (-3, 2, 4), (1, 2, 4), (-4, 1, 3), (-4, -3, -2), (-4, -3, -2), (1, 3, 4), (1, 2, 3), (-3, -2, -1), (-3, -2, 4), (-3, 1, 4), (-4, 1, 3), (-4, 2, 3), (-4, -2, -1), (-3, 2, 4), (-4, -3, -2), (-4, -3, -2), (-4, -2, 3)],
+        [(-1, 2, 4), (-2, -1, 4), (-3, -2, -1), (-1, 2, 4), (-2, -1, 4), (2, 3, 4), (-3, 2, 4), (-3, -1, 2), (-3, 2, 4), (2, 3, 4), (-4, -2, -1), (-2, -1, 3), (-3, 2, 4), (-3, 1, 4), (-4, -2, -1), (2, 3, 4), (-3, -1, 2), (-4, -2, 3), (-3, -1, 4), (-1, 3, 4)],
+        [(-4, -3, 2), (-1, 2, 3), (-3, -2, 1), (-2, 3, 4), (-4, -3, 2), (-2, 1, 4), (-4, -3, -2), (-2, 1, 3), (-2, -1, 4), (-4, -3, 2), (-3, -1, 2), (-4, -3, 1), (-4, 1, 3), (-2, -1, 3), (-3, -1, 2), (-4, -1, 2), (-2, 1, 4), (-3, -2, -1), (-1, 2, 3), (-4, -3, -1)],
+        [(-4, -3, 2), (1, 2, 3), (-4, -3, 2), (-4, -2, -1), (-3, -2, 4), (-2, 1, 3), (-3, -2, -1), (-4, -1, 3), (-4, 1, 3), (-1, 2, 3), (-3, -1, 2), (-3, 2, 4), (1, 2, 3), (-2, 3, 4), (1, 3, 4), (-3, 1, 4), (-3, -2, -1), (1, 2, 4), (-4, 1, 2), (-4, -1, 2)],
+        [(-3, 1, 2), (-2, 1, 3), (2, 3, 4), (-4, 1, 2), (-2, 1, 4), (-3, -1, 2), (1, 3, 4), (-4, 2, 3), (-4, -2, 3), (-4, -3, 2), (-3, 1, 2), (-4, -1, 2), (-4, -3, -2), (-2, -1, 3), (1, 2, 4), (-1, 2, 4), (-4, 2, 3), (-2, 1, 3), (-4, -2, -1), (-2, -1, 3)],
+        [(2, 3, 4), (-3, -2, 1), (-3, 2, 4), (-4, -3, -1), (-2, 1, 3), (-2, -1, 3), (-3, -2, 1), (-2, -1, 4), (-3, 1, 4), (-4, -3, -2), (-1, 2, 3), (-1, 3, 4), (-2, -1, 3), (-3, -1, 4), (-4, -1, 2), (-3, 1, 2), (-2, 1, 4), (1, 2, 4), (-3, 1, 2), (1, 3, 4)],
+        [(-4, -1, 3), (1, 3, 4), (-3, -1, 2), (-4, 1, 2), (-1, 2, 3), (2, 3, 4), (1, 3, 4), (-2, -1, 3), (-2, 1, 3), (-1, 3, 4), (-2, -1, 4), (-4, -3, 2), (-3, -2, 1), (-4, 1, 2), (-2, 1, 3), (-2, 3, 4), (-3, 2, 4), (-4, 1, 3), (-3, 1, 4), (-3, -1, 2)],
+        [(-4, -3, -2), (1, 2, 3), (-3, -2, 1), (1, 3, 4), (-1, 2, 4), (-3, -1, 2), (1, 3, 4), (-3, 1, 2), (-2, -1, 4), (-4, -2, -1), (2, 3, 4), (-1, 3, 4), (2, 3, 4), (-4, -2, -1), (-3, 2, 4), (1, 3, 4), (-4, -3, 2), (-4, -3, -1), (-4, -3, 1), (-4, -3, -1)],
+        [(-3, -1, 4), (-3, 1, 2), (-4, -2, 1), (1, 2, 3), (1, 2, 4), (1, 2, 4), (-2, 3, 4), (2, 3, 4), (-4, 1, 3), (1, 3, 4), (-4, -3, 2), (-4, 1, 3), (-4, 1, 2), (-3, -2, -1), (-3, -1, 4), (-2, -1, 3), (-3, -2, -1), (-4, 1, 2), (-4, -3, 2), (-3, -2, 4)],
+        [(-3, -1, 2), (-4, 2, 3), (-4, -3, 1), (-3, -1, 2), (-3, -2, 4), (-4, 1, 2), (-3, -2, -1), (-4, -1, 2), (-4, -1, 3), (-3, -2, 4), (-2, 1, 3), (-3, -1, 2), (-3, -2, 1), (-4, -3, 2), (1, 2, 3), (-2, 1, 3), (-2, -1, 3), (-1, 2, 4), (-3, -2, 1), (-3, -1, 2)]
+    ]
+    for clauses in clauses_set:
+        print(FastThreeSATSolver().solve(clauses, verbose=True))
+
+
+
+    # UNSAT Cases
+    print("  =============")
+    print("TEST UNSAT")
+    clauses_set =  [
+        [(-4, -2, 1), (-4, 1, 3), (1, 2, 3), (-4, -3, 1), (-4, -1, 3), (-2, 3, 4), (-2, -1, 4), (-4, 1, 2), (-3, -1, 2), (-1, 2, 4), (-4, -2, -1), (-4, -1, 2), (-4, -3, -1), (-3, -2, 1), (1, 3, 4), (-3, 2, 4), (-4, -3, -2), (-4, -2, 1), (-4, -3, -2), (-4, -3, -1)],
+        [(-2, -1, 4), (1, 3, 4), (1, 2, 4), (-4, 1, 2), (-3, -2, -1), (-1, 2, 4), (-4, -3, -2), (-1, 2, 4), (-2, 3, 4), (1, 2, 4), (-4, -2, 1), (-4, -1, 2), (-4, -1, 3), (-4, -3, 2), (-4, -2, 3), (-3, -2, 4), (1, 2, 3), (-3, 1, 4), (-4, -3, 2), (-2, -1, 3)],
+        [(-2, 3, 4), (-2, -1, 3), (1, 2, 3), (-2, 1, 3), (-4, -2, 3), (-1, 2, 4), (-4, -3, 2), (-4, -3, -1), (-3, 1, 4), (1, 2, 3), (-3, -2, 4), (-4, 2, 3), (-4, -3, -2), (-3, -2, 1), (-2, -1, 4), (-4, -3, -1), (-4, -1, 2), (-3, -1, 2), (-3, -2, 4), (-4, -3, -2)],
+        [(-1, 2, 4), (-4, 1, 2), (-3, 1, 2), (-2, 3, 4), (2, 3, 4), (-4, -3, -1), (-4, -3, -1), (1, 2, 3), (-2, 1, 4), (-2, -1, 4), (-4, -2, -1), (-4, -1, 3), (2, 3, 4), (-4, 2, 3), (-4, -2, 3), (-3, -2, 1), (-3, -1, 4), (-1, 2, 3), (-2, 3, 4), (-2, 1, 4)],
+        [(-4, -3, 2), (-4, 1, 2), (-1, 2, 4), (-4, -3, -1), (-4, -2, 1), (-2, 3, 4), (-3, -2, 4), (1, 2, 4), (-2, 1, 4), (-4, -2, 1), (-2, 3, 4), (-2, 1, 4), (-3, 1, 2), (2, 3, 4), (-3, -2, -1), (-4, -1, 3), (-1, 3, 4), (-3, -2, 4), (-3, 2, 4), (-4, 1, 2)],
+        [(-3, -2, -1), (-3, 1, 2), (-1, 2, 4), (-3, -1, 4), (-2, -1, 3), (-4, -1, 2), (-4, 1, 2), (-4, -2, 3), (-4, -3, 2), (-3, 1, 2), (-4, 1, 3), (1, 2, 3), (-4, -3, 1), (-3, -2, 4), (-3, -2, 4), (-3, -1, 4), (-3, -1, 2), (1, 2, 4), (-3, 2, 4), (-2, 1, 4)],
+        [(-2, 1, 4), (-4, 1, 2), (-3, -2, 4), (-3, -2, 4), (-4, -3, 1), (-4, 1, 2), (-4, -3, -1), (-4, -2, -1), (-4, -2, 3), (-1, 3, 4), (-4, -3, -1), (1, 2, 3), (-4, -3, -1), (1, 2, 4), (-3, 2, 4), (-4, -3, -1), (-4, 2, 3), (-4, 1, 2), (2, 3, 4), (-2, 3, 4)],
+        [(-3, -2, 4), (-1, 2, 4), (-2, 3, 4), (1, 2, 4), (-3, -1, 4), (-4, -3, 2), (-3, -1, 2), (-4, -3, 2), (-4, -3, 1), (2, 3, 4), (-2, -1, 4), (-4, -2, -1), (-1, 2, 3), (-3, -1, 2), (-4, -1, 3), (-4, -1, 3), (-4, -2, 1), (-4, -1, 3), (-4, 1, 2), (-2, 3, 4)],
+        [(-4, -3, 2), (2, 3, 4), (-4, -3, 2), (-4, -3, -2), (2, 3, 4), (-3, 1, 2), (-4, -3, -2), (-1, 3, 4), (-3, -2, 1), (-3, -2, 4), (-4, 2, 3), (-1, 2, 3), (-3, -1, 2), (-2, -1, 4), (-3, 1, 2), (-2, 1, 3), (-1, 2, 4), (-2, -1, 3), (-2, -1, 4), (-2, 1, 3)],
+        [(-4, -3, 1), (1, 2, 3), (-4, -2, 1), (-4, -2, 1), (-2, 1, 3), (-4, 1, 3), (-4, -3, -2), (-3, -2, 4), (-2, -1, 4), (-4, -2, 1), (-1, 3, 4), (-4, -1, 3), (-1, 2, 4), (1, 2, 3), (1, 2, 4), (-2, 1, 4), (1, 2, 4), (-3, -1, 2), (-4, 1, 3), (-2, 3, 4)],
+        [(-3, -2, 1), (-4, 2, 3), (-2, 1, 3), (-1, 2, 4), (-3, -2, 1), (-2, -1, 4), (1, 3, 4), (-3, -1, 2), (-4, -1, 2), (-4, -3, 2), (-3, -1, 2), (-2, -1, 4), (-3, 2, 4), (-4, -2, -1), (-2, -1, 3), (-2, 1, 3), (-3, -1, 4), (-4, -1, 2), (-2, 1, 3), (-4, 1, 3)]
+    ]
+    for clauses in clauses_set:
+        print(FastThreeSATSolver().solve(clauses, verbose=True))
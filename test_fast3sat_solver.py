@@ -0,0 +1,177 @@
+"""Randomized cross-checks of the 2-SAT kernels and the solver against brute_force.
+
+Run with python -m unittest (or pytest) from this directory.
+"""
+
+import random
+import unittest
+
+import fast3sat_solver
+from fast3sat_solver import FastThreeSATSolver, _pack, _two_sat_batch, _unpack
+
+
+def random_2sat(rng, n_vars, n_clauses):
+    """Random 1- and 2-literal clauses over n_vars variables, repeats and x/-x pairs allowed."""
+    return [tuple(rng.choice([-1, 1]) * rng.randint(1, n_vars)
+                  for _ in range(1 if rng.random() < 0.3 else 2))
+            for _ in range(n_clauses)]
+
+
+def random_3sat(rng, n_vars, n_clauses):
+    return [tuple(rng.choice([-1, 1]) * v for v in rng.sample(range(1, n_vars + 1), 3))
+            for _ in range(n_clauses)]
+
+
+def as_problem(clauses):
+    """(units, packed pairs) form taken by _two_sat_batch."""
+    units = [c[0] for c in clauses if len(c) == 1]
+    pairs = [_pack(*sorted(c)) for c in clauses if len(c) == 2]
+    return units, pairs
+
+
+class PurePython:
+    """Context manager that forces the pure-Python Tarjan fallback."""
+
+    def __enter__(self):
+        self.kernel = fast3sat_solver._tarjan_2sat
+        fast3sat_solver._tarjan_2sat = None
+
+    def __exit__(self, *exc):
+        fast3sat_solver._tarjan_2sat = self.kernel
+
+
+class TestTwoSAT(unittest.TestCase):
+
+    def check_batches(self, seed):
+        # one batch mixes problem sizes so the per-problem ptr/offset logic is exercised
+        rng = random.Random(seed)
+        for _ in range(200):
+            problems = [random_2sat(rng, rng.randint(1, 7), rng.randint(0, 14))
+                        for _ in range(rng.randint(1, 8))]
+            expected = [FastThreeSATSolver.brute_force(cl) for cl in problems]
+            self.assertEqual(_two_sat_batch([as_problem(cl) for cl in problems]), expected, problems)
+            for cl, sat in zip(problems, expected):
+                self.assertEqual(FastThreeSATSolver.two_sat(cl), sat, cl)
+
+    @unittest.skipIf(fast3sat_solver._tarjan_2sat is None, "numba is not installed")
+    def test_numba_kernel_matches_brute_force(self):
+        self.check_batches(1)
+
+    def test_python_tarjan_matches_brute_force(self):
+        with PurePython():
+            self.check_batches(2)
+
+    @unittest.skipIf(fast3sat_solver._tarjan_2sat is None, "numba is not installed")
+    def test_batches_past_kernel_bound_fall_back(self):
+        bound = fast3sat_solver._KERNEL_MAX_LIT
+        fast3sat_solver._KERNEL_MAX_LIT = 8
+        try:
+            self.check_batches(6)
+        finally:
+            fast3sat_solver._KERNEL_MAX_LIT = bound
+
+    def test_pack_round_trip(self):
+        for a in (-2 ** 40, -2 ** 31, -1, 1, 2 ** 31 - 1, 2 ** 31, 10 ** 20):
+            for b in (-2 ** 31, -1, 1, 2 ** 31 - 1):
+                self.assertEqual(_unpack(_pack(a, b)), (a, b))
+            for b in (-2 ** 31 - 1, 2 ** 31, 10 ** 20):
+                with self.assertRaises(OverflowError):
+                    _pack(a, b)
+
+    def test_huge_literals(self):
+        # two_sat renumbers its literals, so sparse or huge ids must neither size or overflow
+        # the kernel's arrays nor break the 2**32 packing radix
+        for big in (10 ** 8, 10 ** 9, 2 ** 30 - 1, 2 ** 30, 2 ** 30 + 1, 1500000000,
+                    2 ** 31 - 1, 2 ** 31, 2 ** 31 + 1, 2 ** 32, 2 ** 63, 10 ** 20):
+            for clauses in ([(big, 3), (-big, 3)],
+                            [(big, 1), (-big, 1), (-1,)],
+                            [(1, big), (1, -big), (-1,)],
+                            [(big, -big), (big,)],
+                            [(big, 1), (-big, 1), (big, -1), (-big, -1)]):
+                self.assertEqual(FastThreeSATSolver.two_sat(clauses),
+                                 FastThreeSATSolver.brute_force(clauses), clauses)
+        rng = random.Random(5)
+        for _ in range(200):
+            problems = []
+            for _ in range(rng.randint(1, 6)):
+                variables = [rng.choice((rng.randint(1, 5), rng.randint(2 ** 29, 2 ** 31 - 1)))
+                             for _ in range(rng.randint(1, 5))]
+                problems.append([tuple(rng.choice([-1, 1]) * rng.choice(variables)
+                                       for _ in range(rng.randint(1, 2)))
+                                 for _ in range(rng.randint(0, 10))])
+            expected = [FastThreeSATSolver.brute_force(cl) for cl in problems]
+            self.assertEqual(_two_sat_batch([as_problem(cl) for cl in problems]), expected, problems)
+
+
+class TestSolve(unittest.TestCase):
+
+    def test_solve_paths_agree(self):
+        # solve may miss an UNSAT, but never reports UNSAT for a satisfiable formula;
+        # every ingestion path and the pure-Python fallback must give the same verdict
+        rng = random.Random(3)
+        for _ in range(300):
+            clauses = random_3sat(rng, rng.randint(3, 8), rng.randint(1, 45))
+            sat = FastThreeSATSolver().solve(clauses)
+            if not sat:
+                self.assertFalse(FastThreeSATSolver.brute_force(clauses), clauses)
+            with PurePython():
+                self.assertEqual(FastThreeSATSolver().solve(clauses), sat, clauses)
+            k = rng.randint(0, len(clauses))
+            solver = FastThreeSATSolver()
+            solver.solve(clauses[:k])
+            self.assertEqual(solver.solve(clauses[k:]), sat, clauses)
+            if fast3sat_solver.np is not None:
+                arr = fast3sat_solver.np.array(clauses)
+                self.assertEqual(FastThreeSATSolver().solve(arr), sat, clauses)
+
+    def test_large_batches_agree(self):
+        # lists of NUMPY_MIN_CLAUSES or more take the vectorized ingestion path
+        rng = random.Random(4)
+        instances = [random_3sat(rng, rng.randint(5, 12), rng.randint(64, 90)) for _ in range(30)]
+        expected = []
+        for clauses in instances:
+            with PurePython():
+                small = FastThreeSATSolver()
+                for i in range(0, len(clauses), 32):
+                    small.add_clauses(clauses[i:i + 32])
+                expected.append(small.twosat_sets.find_unsat() is False)
+        self.assertEqual([FastThreeSATSolver().solve(cl) for cl in instances], expected)
+        self.assertEqual(FastThreeSATSolver.solve_many(instances), expected)
+
+    def test_malformed_lists_raise(self):
+        # the same ValueError below and above NUMPY_MIN_CLAUSES, with nothing half-added
+        good = [(1, 2, 3), (-1, 2, -3)]
+        for bad in ([(1, 2)], [(1, 2, 3, 4)], [(1, 2), (1, 2, 3)]):
+            for n in (3, 66):
+                clauses = good * n + bad * n
+                solver = FastThreeSATSolver()
+                with self.assertRaises(ValueError, msg=(n, bad)):
+                    solver.solve(clauses)
+                self.assertEqual(len(solver.twosat_sets.fwd_src), 0)
+
+    def test_ids_past_int64(self):
+        # ids numpy cannot hold go through the per-clause loop at any batch size
+        big = 10 ** 20
+        cube = [(sa * big, sb * 2, sc * 3) for sa in (1, -1) for sb in (1, -1) for sc in (1, -1)]
+        for n in (1, 10):
+            self.assertTrue(FastThreeSATSolver().solve([(big, 2, 3)] * 70 * n))
+            self.assertFalse(FastThreeSATSolver().solve(cube * n))
+
+    @unittest.skipIf(fast3sat_solver.np is None, "numpy is not installed")
+    def test_malformed_arrays_raise(self):
+        np = fast3sat_solver.np
+        for bad in (np.array([(1, 2, 3, 4), (-1, -2, -3, -4), (1, -2, 3, -4)]),
+                    np.array([1, 2, 3, -1, -2, -3]),
+                    np.array([(1.5, 2, 3)])):
+            with self.assertRaises(ValueError, msg=bad):
+                FastThreeSATSolver().solve(bad)
+        self.assertTrue(FastThreeSATSolver().solve(np.array([])))
+        # 2**63 + 1 must not wrap to -(2**63 - 1) and contradict the first clause
+        a, b = 2 ** 63 - 1, 2 ** 63 + 1
+        for n in (1, 40):
+            self.assertTrue(FastThreeSATSolver().solve(np.array([(a, a, a), (b, b, b)] * n, np.uint64)))
+        self.assertTrue(FastThreeSATSolver().solve(np.array([(1, 2, 3)] * 70, np.uint64)))
+
+
+if __name__ == "__main__":
+    unittest.main()